@@ -29,6 +29,22 @@ const FAVORITE_APPS = [
     { packageName: 'com.android.settings', label: 'Settings' },
 ];
 
+// Emoji icons for known apps
+const APP_ICONS: Record<string, string> = {
+    'com.android.chrome': '🌐',
+    'com.google.android.apps.messaging': '💬',
+    'com.google.android.dialer': '📞',
+    'com.google.android.apps.photos': '🖼️',
+    'com.google.android.gm': '📧',
+    'com.google.android.calendar': '📅',
+    'com.google.android.apps.maps': '🗺️',
+    'com.spotify.music': '🎵',
+    'org.telegram.messenger': '✈️',
+    'com.whatsapp': '💬',
+    'md.obsidian': '🗄️',
+    'com.android.settings': '⚙️',
+};
+
 class AppLauncherServiceClass {
     /**
      * Get favorite apps for the drawer
@@ -80,21 +96,7 @@ class AppLauncherServiceClass {
      * Get icon for app (emoji fallback)
      */
     getAppIcon(packageName: string): string {
-        const icons: Record<string, string> = {
-            'com.android.chrome': '🌐',
-            'com.google.android.apps.messaging': '💬',
-            'com.google.android.dialer': '📞',
-            'com.google.android.apps.photos': '🖼️',
-            'com.google.android.gm': '📧',
-            'com.google.android.calendar': '📅',
-            'com.google.android.apps.maps': '🗺️',
-            'com.spotify.music': '🎵',
-            'org.telegram.messenger': '✈️',
-            'com.whatsapp': '💬',
-            'md.obsidian': '🗄️',
-            'com.android.settings': '⚙️',
-        };
-        return icons[packageName] || '📱';
+        return APP_ICONS[packageName] || '📱';
     }
 }
 
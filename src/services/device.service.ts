@@ -27,8 +27,10 @@ class DeviceServiceClass {
      */
     async getBatteryLevel(): Promise<BatteryInfo> {
         try {
-            const level = await DeviceInfo.getBatteryLevel();
-            const charging = await DeviceInfo.isBatteryCharging();
+            const [level, charging] = await Promise.all([
+                DeviceInfo.getBatteryLevel(),
+                DeviceInfo.isBatteryCharging(),
+            ]);
 
             return {
                 level: Math.round(level * 100), // API returns 0-1, convert to 0-100
@@ -8,6 +8,16 @@ import { Vibration, Platform } from 'react-native';
 
 type FeedbackType = 'light' | 'medium' | 'heavy' | 'success' | 'error' | 'selection';
 
+// Different patterns for different feedback types
+const PATTERNS: Record<FeedbackType, number | number[]> = {
+    light: 10,
+    medium: 20,
+    heavy: 40,
+    success: [0, 10, 50, 10],
+    error: [0, 50, 50, 50],
+    selection: 5,
+};
+
 class HapticServiceClass {
     private enabled: boolean = true;
 
@@ -24,17 +34,7 @@ class HapticServiceClass {
     trigger(type: FeedbackType = 'light'): void {
         if (!this.enabled) return;
 
-        // Different patterns for different feedback types
-        const patterns: Record<FeedbackType, number | number[]> = {
-            light: 10,
-            medium: 20,
-            heavy: 40,
-            success: [0, 10, 50, 10],
-            error: [0, 50, 50, 50],
-            selection: 5,
-        };
-
-        const pattern = patterns[type];
+        const pattern = PATTERNS[type];
 
         if (Platform.OS === 'android') {
             if (Array.isArray(pattern)) {
@@ -45,9 +45,11 @@ class SyncServiceClass {
                 return null;
             }
 
-            const captures = await this.loadAllItems('capture');
-            const decisions = await this.loadAllItems('decision');
-            const sessions = await this.loadAllItems('session');
+            const [captures, decisions, sessions] = await Promise.all([
+                this.loadAllItems('capture'),
+                this.loadAllItems('decision'),
+                this.loadAllItems('session'),
+            ]);
 
             const dates = items.map(i => i.createdAt.getTime());
 